@@ -87,4 +87,15 @@ apply_lintransform(
     const coord_t* const input, /* [ncoords] */
     coord_t* output);
 
+/**
+Determine whether a linear transformation leaves coordinates unchanged.
+
+@param coeffs A set of coeffs, for example created by compute_lintransform
+
+@return Non-zero if the transformation is the identity
+*/
+int
+lintransform_is_identity(
+    const lintransform_t* const coeffs);
+
 #endif /* _STIMAGE_LINTRANSFORM_H_ */
@@ -121,6 +121,20 @@ determine_bbox(
     const coord_t* const a,
     bbox_t* const bbox);
 
+/**
+Like determine_bbox, but also computes the mean of the coordinates in
+the same pass.  This is equivalent to calling compute_mean_coord
+followed by determine_bbox, but only walks the array once.
+
+mean may be NULL, in which case it is not computed.
+ */
+void
+determine_bbox_and_mean(
+    size_t n,
+    const coord_t* const a,
+    bbox_t* const bbox,
+    coord_t* const mean);
+
 /**
 Makes the bbox non-singular
  */
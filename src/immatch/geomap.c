@@ -39,6 +39,7 @@ DAMAGE.
 #define _USE_MATH_DEFINES       /* needed for MS Windows to define M_PI */ 
 #include <math.h>
 #include <stdio.h>
+#include <string.h>
 
 #include "immatch/geomap.h"
 #include "lib/xybbox.h"
@@ -269,6 +270,8 @@ compute_residuals(
     return 0;
 }
 
+/* Computes the X and Y fit rms and, in the same pass over the
+   weights, the number of zero-weighted points */
 static void
 compute_rms(
         const size_t ncoord,
@@ -277,23 +280,31 @@ compute_rms(
         const double* const residual_y,
         /* Output */
         double* const xrms,
-        double* const yrms) {
+        double* const yrms,
+        size_t* const n_zero_weighted) {
 
-    size_t i = 0;
+    size_t i     = 0;
+    size_t count = 0;
 
     assert(weights);
     assert(residual_x);
     assert(residual_y);
     assert(xrms);
     assert(yrms);
+    assert(n_zero_weighted);
 
     /* Compute the X and Y fit rms */
     *xrms = 0.0;
     *yrms = 0.0;
     for (i = 0; i < ncoord; ++i) {
+        if (weights[i] <= 0.0) {
+            ++count;
+        }
         *xrms += weights[i] * residual_x[i] * residual_x[i];
         *yrms += weights[i] * residual_y[i] * residual_y[i];
     }
+
+    *n_zero_weighted = count;
 }
 
 static size_t
@@ -395,7 +406,7 @@ geo_fit_theta(
     for (i = 0; i < ncoord; ++i) {
         syrxi += weights[i] * (ref[i].y - r0.y) * (input[i].x - i0.x);
         sxryi += weights[i] * (ref[i].x - r0.x) * (input[i].y - i0.y);
-        sxryi += weights[i] * (ref[i].x - r0.x) * (input[i].x - i0.x);
+        sxrxi += weights[i] * (ref[i].x - r0.x) * (input[i].x - i0.x);
         syryi += weights[i] * (ref[i].y - r0.y) * (input[i].y - i0.y);
     }
 
@@ -448,12 +459,11 @@ geo_fit_theta(
                 sx1, sy1, ncoord, input, ref, residual_x, residual_y,
                 error)) goto exit;
 
-    /* Compute the number of zero-weighted points */
-    fit->n_zero_weighted = count_zero_weighted(ncoord, weights);
-
-    /* Compute the rms of the x and y fits */
+    /* Compute the rms of the x and y fits and the number of
+       zero-weighted points */
     compute_rms(
-            ncoord, weights, residual_x, residual_y, &fit->xrms, &fit->yrms);
+            ncoord, weights, residual_x, residual_y, &fit->xrms, &fit->yrms,
+            &fit->n_zero_weighted);
 
     fit->ncoord = ncoord;
 
@@ -604,12 +614,11 @@ geo_fit_magnify(
                 sx1, sy1, ncoord, input, ref, residual_x, residual_y,
                 error)) goto exit;
 
-    /* Compute the number of zero-weighted points */
-    fit->n_zero_weighted = count_zero_weighted(ncoord, weights);
-
-    /* Compute the rms of the x and y fits */
+    /* Compute the rms of the x and y fits and the number of
+       zero-weighted points */
     compute_rms(
-            ncoord, weights, residual_x, residual_y, &fit->xrms, &fit->yrms);
+            ncoord, weights, residual_x, residual_y, &fit->xrms, &fit->yrms,
+            &fit->n_zero_weighted);
 
     fit->ncoord = ncoord;
 
@@ -738,7 +747,7 @@ geo_fit_linear(
     cthetac.x = xmag * ctheta;
     sthetac.x = ymag * stheta;
     sthetac.y = xmag * stheta;
-    cthetac.x = ymag * ctheta;
+    cthetac.y = ymag * ctheta;
 
     /* Compute the X and Y fit coefficients */
     if (compute_surface_coefficients(
@@ -750,12 +759,11 @@ geo_fit_linear(
                 sx1, sy1, ncoord, input, ref, residual_x, residual_y,
                 error)) goto exit;
 
-    /* Compute the number of zero-weighted points */
-    fit->n_zero_weighted = count_zero_weighted(ncoord, weights);
-
-    /* Compute the rms of the x and y fits */
+    /* Compute the rms of the x and y fits and the number of
+       zero-weighted points */
     compute_rms(
-            ncoord, weights, residual_x, residual_y, &fit->xrms, &fit->yrms);
+            ncoord, weights, residual_x, residual_y, &fit->xrms, &fit->yrms,
+            &fit->n_zero_weighted);
 
     fit->ncoord = ncoord;
 
@@ -820,8 +828,8 @@ geo_fit_xy(
         stimage_error_t* error) {
 
     bbox_t              bbox;
+    double*             z         = NULL;
     double*             zfit      = NULL;
-    const double* const z = (double*)input + (xfit ? 0 : 1);
     surface_t           savefit;
     surface_fit_error_e fit_error = surface_fit_error_ok;
     size_t              i         = 0;
@@ -843,6 +851,21 @@ geo_fit_xy(
 
     *has_secondary = 1;
 
+    /* Gather the coordinate being fit into a contiguous array once,
+       since surface_fit and surface_vector expect unstrided data */
+    z = malloc_with_error(ncoord * sizeof(double), error);
+    if (z == NULL) goto exit;
+
+    if (xfit) {
+        for (i = 0; i < ncoord; ++i) {
+            z[i] = input[i].x;
+        }
+    } else {
+        for (i = 0; i < ncoord; ++i) {
+            z[i] = input[i].y;
+        }
+    }
+
     zfit = malloc_with_error(ncoord * sizeof(double), error);
     if (zfit == NULL) goto exit;
 
@@ -860,7 +883,7 @@ geo_fit_xy(
                         sf1, fit->function, 1, 1, xterms_none, &bbox,
                         error)) goto exit;
             for (i = 0; i < ncoord; ++i) {
-                zfit[i] = z[i<<1] - ref[i].x;
+                zfit[i] = z[i] - ref[i].x;
             }
 
             if (surface_fit(
@@ -923,7 +946,7 @@ geo_fit_xy(
                         sf1, fit->function, 1, 1, xterms_none, &bbox,
                         error)) goto exit;
             for (i = 0; i < ncoord; ++i) {
-                zfit[i] = z[i<<1] - ref[i].y;
+                zfit[i] = z[i] - ref[i].y;
             }
             if (surface_fit(
                         sf1, ncoord, ref, zfit, weights,
@@ -978,7 +1001,7 @@ geo_fit_xy(
 
     if (surface_vector(sf1, ncoord, ref, residual, error)) goto exit;
     for (i = 0; i < ncoord; ++i) {
-        residual[i] = z[i<<1] - residual[i];
+        residual[i] = z[i] - residual[i];
     }
 
     /* Calculate the higher-order fit */
@@ -991,7 +1014,7 @@ geo_fit_xy(
 
         if (surface_vector(sf2, ncoord, ref, zfit, error)) goto exit;
         for (i = 0; i < ncoord; ++i) {
-            residual[i] = zfit[i] - residual[i];
+            residual[i] = residual[i] - zfit[i];
         }
     }
 
@@ -1019,6 +1042,7 @@ geo_fit_xy(
 
     surface_free(&savefit);
     free(zfit);
+    free(z);
 
     return status;
 }
@@ -1074,9 +1098,7 @@ geo_fit_reject(
 
     /* Initialize the temporary weights array and the number of
        rejected points */
-    for (i = 0; i < ncoord; ++i) {
-        tweights[i] = weights[i];
-    }
+    memcpy(tweights, weights, ncoord * sizeof(double));
 
     do { /* while (niter < fit->maxiter) */
         /* Compute the rejection limits */
@@ -1093,11 +1115,11 @@ geo_fit_reject(
         /* Reject points from the fit */
         for (i = 0; i < ncoord; ++i) {
             if (tweights[i] > 0.0 &&
-                ((abs(residual_x[i]) > cutx) || abs(residual_y[i]) > cuty)) {
+                (fabs(residual_x[i]) > cutx || fabs(residual_y[i]) > cuty)) {
                 tweights[i] = 0.0;
-                ++nreject;
                 assert(nreject < ncoord);
                 fit->rej[nreject] = i;
+                ++nreject;
             }
         }
 
@@ -1106,10 +1128,9 @@ geo_fit_reject(
         }
         fit->nreject = nreject;
 
-        /* Compute the number of deleted points */
-        fit->n_zero_weighted = count_zero_weighted(ncoord, weights);
-
-        /* Recompute the X and Y fit */
+        /* Recompute the X and Y fit.  The number of zero-weighted
+           points is recounted from tweights by the fit and by
+           compute_rms below, so it need not be counted here. */
         switch (fit->fit_geometry) {
         case geomap_fit_rotate:
             if (geo_fit_theta(
@@ -1139,7 +1160,7 @@ geo_fit_reject(
         /* Compute the X and Y fit rms */
         compute_rms(
                 ncoord, tweights, residual_x, residual_y,
-                &fit->xrms, &fit->yrms);
+                &fit->xrms, &fit->yrms, &fit->n_zero_weighted);
 
         ++niter;
     } while (niter < fit->maxiter);
@@ -1212,11 +1233,11 @@ geofit(
         break;
     default:
         if (geo_fit_xy(
-                    fit, sx1, sx2, ncoord, 0, input, ref, has_sx2, weights,
+                    fit, sx1, sx2, ncoord, 1, input, ref, has_sx2, weights,
                     residual_x, error)
             ||
             geo_fit_xy(
-                    fit, sy1, sy2, ncoord, 1, input, ref, has_sy2, weights,
+                    fit, sy1, sy2, ncoord, 0, input, ref, has_sy2, weights,
                     residual_y, error)) goto exit;
         break;
     }
@@ -1308,12 +1329,13 @@ geo_get_coeff(
     size_t nxxcoeff, nxycoeff, nyxcoeff, nyycoeff;
     double xxrange  = 1.0;
     double xyrange  = 1.0;
-    double xxmaxmin = 1.0;
-    double xymaxmin = 1.0;
+    double xxmaxmin = 0.0;
+    double xymaxmin = 0.0;
     double yxrange  = 1.0;
     double yyrange  = 1.0;
-    double yxmaxmin = 1.0;
-    double yymaxmin = 1.0;
+    double yxmaxmin = 0.0;
+    double yymaxmin = 0.0;
+    double xx, xy, yx, yy;
     double a, b, c, d;
 
     assert(sx);
@@ -1323,59 +1345,46 @@ geo_get_coeff(
     assert(rot);
     assert(sx->coeff);
     assert(sy->coeff);
-    assert(sx->ncoeff >= 3);
-    assert(sy->ncoeff >= 3);
 
-    nxxcoeff = nyxcoeff = sx->nxcoeff;
-    nxycoeff = nyycoeff = sy->nycoeff;
+    nxxcoeff = sx->nxcoeff;
+    nxycoeff = sx->nycoeff;
+    nyxcoeff = sy->nxcoeff;
+    nyycoeff = sy->nycoeff;
 
     /* Get the data range */
     if (sx->type != surface_type_polynomial) {
         xxrange = (sx->bbox.max.x - sx->bbox.min.x) / 2.0;
-        xxmaxmin = -(sx->bbox.max.x - sx->bbox.min.x) / 2.0;
+        xxmaxmin = -(sx->bbox.max.x + sx->bbox.min.x) / 2.0;
         xyrange = (sx->bbox.max.y - sx->bbox.min.y) / 2.0;
-        xymaxmin = (sx->bbox.max.y - sx->bbox.min.y) / 2.0;
+        xymaxmin = -(sx->bbox.max.y + sx->bbox.min.y) / 2.0;
     }
 
     if (sy->type != surface_type_polynomial) {
         yxrange = (sy->bbox.max.x - sy->bbox.min.x) / 2.0;
-        yxmaxmin = (sy->bbox.max.x - sy->bbox.min.x) / 2.0;
+        yxmaxmin = -(sy->bbox.max.x + sy->bbox.min.x) / 2.0;
         yyrange = (sy->bbox.max.y - sy->bbox.min.y) / 2.0;
-        yymaxmin = (sy->bbox.max.y - sy->bbox.min.y) / 2.0;
+        yymaxmin = -(sy->bbox.max.y + sy->bbox.min.y) / 2.0;
     }
 
+    /* DIFF: The original always reads the linear terms from
+       coefficients 1 and 2.  Here the term counts are checked first,
+       so that surfaces with no x or no y term (as in the xyscale
+       geometry) never read past the end of the coefficients, and the
+       y term is found after all of the x terms. */
+    xx = (nxxcoeff > 1) ? sx->coeff[1] : 0.0;
+    xy = (nxycoeff > 1) ? sx->coeff[nxxcoeff] : 0.0;
+    yx = (nyxcoeff > 1) ? sy->coeff[1] : 0.0;
+    yy = (nyycoeff > 1) ? sy->coeff[nyxcoeff] : 0.0;
+
     /* Get the shifts */
-    shift->x = sx->coeff[0] + \
-        sx->coeff[1] * xxmaxmin / xxrange + \
-        sx->coeff[2] * xymaxmin / xyrange;
-    shift->y = sy->coeff[0] + \
-        sy->coeff[1] * yxmaxmin / yxrange +
-        sx->coeff[2] * yymaxmin / yyrange;
+    shift->x = sx->coeff[0] + xx * xxmaxmin / xxrange + xy * xymaxmin / xyrange;
+    shift->y = sy->coeff[0] + yx * yxmaxmin / yxrange + yy * yymaxmin / yyrange;
 
     /* Get the rotation and scaling parameters */
-    if (nxxcoeff > 1) {
-        a = sx->coeff[1] / xxrange;
-    } else {
-        a = 0.0;
-    }
-
-    if (nxycoeff > 1) {
-        b = sx->coeff[nxxcoeff] / xyrange;
-    } else {
-        b = 0.0;
-    }
-
-    if (nyxcoeff > 1) {
-        c = sx->coeff[1] / yxrange;
-    } else {
-        c = 0.0;
-    }
-
-    if (nyycoeff > 1) {
-        d = sy->coeff[nyxcoeff] / yyrange;
-    } else {
-        d = 0.0;
-    }
+    a = xx / xxrange;
+    b = xy / xyrange;
+    c = yx / yxrange;
+    d = yy / yyrange;
 
     scale->x = sqrt(a*a + c*c);
     scale->y = sqrt(b*b + d*d);
@@ -1416,7 +1425,6 @@ geo_get_results(
         stimage_error_t* const error) {
 
     long   ngood  = 0;
-    size_t i      = 0;
     int    status = 1;
 
     assert(fit);
@@ -1450,25 +1458,19 @@ geo_get_results(
     result->nxcoeff = sx1->ncoeff;
     result->xcoeff = malloc_with_error(result->nxcoeff * sizeof(double), error);
     if (result->xcoeff == NULL) goto exit;
-    for (i = 0; i < result->nxcoeff; ++i) {
-        result->xcoeff[i] = sx1->coeff[i];
-    }
+    memcpy(result->xcoeff, sx1->coeff, result->nxcoeff * sizeof(double));
 
     result->nycoeff = sy1->ncoeff;
     result->ycoeff = malloc_with_error(result->nycoeff * sizeof(double), error);
     if (result->ycoeff == NULL) goto exit;
-    for (i = 0; i < result->nycoeff; ++i) {
-        result->ycoeff[i] = sy1->coeff[i];
-    }
+    memcpy(result->ycoeff, sy1->coeff, result->nycoeff * sizeof(double));
 
     if (has_sx2) {
         result->nx2coeff = sx2->ncoeff;
         result->x2coeff = malloc_with_error(
                 result->nx2coeff * sizeof(double), error);
         if (result->x2coeff == NULL) goto exit;
-        for (i = 0; i < result->nx2coeff; ++i) {
-            result->x2coeff[i] = sx2->coeff[i];
-        }
+        memcpy(result->x2coeff, sx2->coeff, result->nx2coeff * sizeof(double));
 
     } else {
         result->nx2coeff = 0;
@@ -1480,9 +1482,7 @@ geo_get_results(
         result->y2coeff = malloc_with_error(
                 result->ny2coeff * sizeof(double), error);
         if (result->y2coeff == NULL) goto exit;
-        for (i = 0; i < result->ny2coeff; ++i) {
-            result->y2coeff[i] = sy2->coeff[i];
-        }
+        memcpy(result->y2coeff, sy2->coeff, result->ny2coeff * sizeof(double));
     } else {
         result->ny2coeff = 0;
         result->y2coeff = NULL;
@@ -1532,7 +1532,6 @@ geomap(
     double*          xfit           = NULL;
     double*          yfit           = NULL;
     double*          weights        = NULL;
-    double*          tweights       = NULL;
     geomap_output_t* outi           = NULL;
     surface_t        sx1, sy1, sx2, sy2;
     int              has_sx2        = 0;
@@ -1592,8 +1591,8 @@ geomap(
                 ninput, input, ref, &tbbox, input_in_bbox, ref_in_bbox);
     }
 
-    /* Compute the mean of the reference and input coordinates */
-    compute_mean_coord(nref_in_bbox, ref_in_bbox, &fit.oref);
+    /* Compute the mean of the input coordinates.  The mean of the
+       reference coordinates is computed along with their bbox below. */
     compute_mean_coord(ninput_in_bbox, input_in_bbox, &fit.oin);
 
     /* Set the reference point for the projections to undefined */
@@ -1615,8 +1614,9 @@ geomap(
         weights[i] = 1.0;
     }
 
-    /* Determine the actual max and min of the coordinates */
-    determine_bbox(nref_in_bbox, ref_in_bbox, &tbbox);
+    /* Determine the actual max and min of the coordinates, and their
+       mean */
+    determine_bbox_and_mean(nref_in_bbox, ref_in_bbox, &tbbox, &fit.oref);
     bbox_copy(&tbbox, &fit.bbox);
 
     if (geofit(
@@ -1635,20 +1635,13 @@ geomap(
 
     /* DIFF: This section is from geo_plistd */
 
-    /* Copy the results to the output buffer */
-    tweights = malloc_with_error(ninput_in_bbox * sizeof(double), error);
-    if (tweights == NULL) goto exit;
-
-    for (i = 0; i < ninput_in_bbox; ++i) {
-        tweights[i] = weights[i];
-    }
-
+    /* Copy the results to the output buffer.  The weights are no
+       longer needed by the fit, so the rejected points are flagged in
+       place rather than in a copy. */
     for (i = 0; i < fit.nreject; ++i) {
         assert(fit.rej);
         assert(fit.rej[i] < ninput_in_bbox);
-        if (weights[fit.rej[i]] > 0.0) {
-            tweights[fit.rej[i]] = 0.0;
-        }
+        weights[fit.rej[i]] = 0.0;
     }
 
     outi = output;
@@ -1657,7 +1650,7 @@ geomap(
         outi->ref.y = ref_in_bbox[i].y;
         outi->input.x = input_in_bbox[i].x;
         outi->input.y = input_in_bbox[i].y;
-        if (tweights[i] > 0.0) {
+        if (weights[i] > 0.0) {
             outi->fit.x = xfit[i];
             outi->fit.y = yfit[i];
             outi->residual.x = input_in_bbox[i].x - xfit[i];
@@ -1684,7 +1677,6 @@ geomap(
     free(weights);
     free(xfit);
     free(yfit);
-    free(tweights);
     surface_free(&sx1);
     surface_free(&sy1);
     surface_free(&sx2);
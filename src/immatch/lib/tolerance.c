@@ -58,6 +58,8 @@ match_tolerance(
     size_t         input_index = 0;
     size_t         ref_index   = 0;
     double         dx, dy, rmax2, r2;
+    const coord_t* refp;
+    const coord_t* inputp;
     const coord_t* rmatch;
     const coord_t* lmatch;
 
@@ -69,9 +71,13 @@ match_tolerance(
     assert(error);
 
     for (rp = 0; rp < nref; ++rp) {
+        /* Bind the reference object once, rather than reloading it
+           through ref_sorted in each of the search loops below */
+        refp = ref_sorted[rp];
+
         /* Compute the start of the search range */
         for (; blp < ninput; ++blp) {
-            dy = ref_sorted[rp]->y - input_sorted[blp]->y;
+            dy = refp->y - input_sorted[blp]->y;
             if (dy < tolerance) {
                 break;
             }
@@ -94,18 +100,19 @@ match_tolerance(
         lmatch = NULL;
         for (lp = blp; lp < ninput; ++lp) {
             /* Compute the distance between the two points */
-            dy = ref_sorted[rp]->y - input_sorted[lp]->y;
+            inputp = input_sorted[lp];
+            dy = refp->y - inputp->y;
             if (dy < -tolerance) {
                 break;
             }
-            dx = ref_sorted[rp]->x - input_sorted[lp]->x;
+            dx = refp->x - inputp->x;
             r2 = dx*dx + dy*dy;
 
             /* A match has been found */
             if (r2 <= rmax2) {
                 rmax2 = r2;
-                rmatch = ref_sorted[rp];
-                lmatch = input_sorted[lp];
+                rmatch = refp;
+                lmatch = inputp;
             }
         }
 
@@ -84,8 +84,25 @@ triangle_ratio_compare(
     }
 }
 
-int
-find_triangles(
+static int
+check_maxratio(
+        const double maxratio,
+        stimage_error_t* const error) {
+
+    if (maxratio > 10.0 || maxratio < 5.0) {
+        stimage_error_format_message(
+            error,
+            "maxratio should be in the range 5.0 - 10.0 (%f)", maxratio);
+        return 1;
+    }
+
+    return 0;
+}
+
+/* The same as find_triangles, but assumes that maxratio has already
+   been checked */
+static int
+_find_triangles(
         const size_t ncoords,
         const coord_t* const * const coords,
         size_t* ntriangles,
@@ -96,6 +113,7 @@ find_triangles(
         stimage_error_t* const error) {
 
     const double tol2 = tolerance * tolerance;
+    const double maxratio2 = maxratio * maxratio;
     const size_t nsample = MAX(1, ncoords / maxnpoints);
     const size_t npoints = MIN(ncoords, nsample * maxnpoints);
     triangle_t* tri = triangles;
@@ -111,13 +129,6 @@ find_triangles(
     assert(triangles);
     assert(error);
 
-    if (maxratio > 10.0 || maxratio < 5.0) {
-        stimage_error_format_message(
-            error,
-            "maxratio should be in the range 5.0 - 10.0 (%f)", maxratio);
-        return 1;
-    }
-
     for (i = 0; i < npoints - (2 * nsample); i += nsample) {
         for (j = i + nsample; j < npoints - nsample; j += nsample) {
             dist_ij = euclid_distance2(coords[i], coords[j]);
@@ -140,8 +151,8 @@ find_triangles(
                     if (ntri >= *ntriangles) {
                         stimage_error_format_message(
                             error,
-                            "Found more triangles than were allocated for (%d)\n",
-                            *ntriangles);
+                            "Found more triangles than were allocated for (%lu)\n",
+                            (unsigned long)*ntriangles);
                         return 1;
                     }
                 #endif /* NDEBUG */
@@ -192,16 +203,20 @@ find_triangles(
                         tri->vertices[sides_def[m][1]]->y;
                     sides2[m] = dx[m]*dx[m] + dy[m]*dy[m];
                     assert(sides2[m] >= 0.0);
-                    sides[m] = sqrt(sides2[m]);
                 }
 
                 /* If the ratio of long to short is too high, reject
-                   this triangle */
-                ratio = sides[2] / sides[1];
-                if (ratio > maxratio) {
+                   this triangle.  Compare the squared lengths so that
+                   rejected triangles never pay for the square roots. */
+                if (sides2[2] > maxratio2 * sides2[1]) {
                     continue;
                 }
 
+                for (m = 0; m < 3; ++m) {
+                    sides[m] = sqrt(sides2[m]);
+                }
+                ratio = sides[2] / sides[1];
+
                 /* Compute the cos, cos ** 2 and sin ** 2 of the angle at
                    vertex 1. */
                 cosc = (dx[2]*dx[1] + dy[2]*dy[1]) / (sides[2]*sides[1]);
@@ -237,6 +252,24 @@ find_triangles(
     return 0;
 }
 
+int
+find_triangles(
+        const size_t ncoords,
+        const coord_t* const * const coords,
+        size_t* ntriangles,
+        triangle_t* triangles,
+        const size_t maxnpoints,
+        const double tolerance,
+        const double maxratio,
+        stimage_error_t* const error) {
+
+    if (check_maxratio(maxratio, error)) return 1;
+
+    return _find_triangles(
+            ncoords, coords, ntriangles, triangles, maxnpoints, tolerance,
+            maxratio, error);
+}
+
 int
 merge_triangles(
         const size_t nr_triangles,
@@ -624,7 +657,7 @@ _match_triangles(
             nref_triangles * sizeof(triangle_t), error);
     if (ref_triangles == NULL) goto exit;
 
-    if (find_triangles(nref, ref_sorted, &nref_triangles, ref_triangles,
+    if (_find_triangles(nref, ref_sorted, &nref_triangles, ref_triangles,
                        nmatch, tolerance, maxratio, error)) goto exit;
 
     if (nref_triangles == 0) {
@@ -641,7 +674,7 @@ _match_triangles(
             ninput_triangles * sizeof(triangle_t), error);
     if (input_triangles == NULL) goto exit;
 
-    if (find_triangles(ninput, input_sorted, &ninput_triangles,
+    if (_find_triangles(ninput, input_sorted, &ninput_triangles,
                        input_triangles, nmatch, tolerance, maxratio,
                        error)) goto exit;
 
@@ -755,6 +788,10 @@ match_triangles(
     size_t          i                  = 0;
     int             status             = 1;
 
+    /* Check maxratio once here, rather than on each of the (up to
+       four) triangle searches below */
+    if (check_maxratio(maxratio, error)) goto exit;
+
     refcoord_matches = malloc_with_error(
             ncoord_matches * sizeof(coord_t*), error);
     if (refcoord_matches == NULL) goto exit;
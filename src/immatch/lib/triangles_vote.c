@@ -153,9 +153,9 @@ vote_triangle_matches(
 
         /* Remove all future matches involving the input coord, so it
            won't be matched twice. */
-        for (ri2 = ri; ri2 < nright; ++ri2) {
-            li = l_coord - left;
-            VOTE(li, ri) = 0;
+        li = l_coord - left;
+        for (ri2 = ri + 1; ri2 < nright; ++ri2) {
+            VOTE(li, ri2) = 0;
         }
 
         #ifndef NDEBUG
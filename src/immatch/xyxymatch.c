@@ -64,8 +64,8 @@ xyxymatch_callback(
     if (state->outputp >= state->noutput) {
         stimage_error_format_message(
             error,
-            "Number of output coordinates exceeded allocation (%d)",
-            state->noutput);
+            "Number of output coordinates exceeded allocation (%lu)",
+            (unsigned long)state->noutput);
         return 1;
     }
 
@@ -118,7 +118,8 @@ xyxymatch(
     static const coord_t      DEFAULT_MAG        = {1.0, 1.0};
     static const coord_t      DEFAULT_ROTATION   = {0.0, 0.0};
     static const coord_t      DEFAULT_REF_ORIGIN = {0.0, 0.0};
-    coord_t*                  input_trans        = NULL;
+    coord_t*                  input_trans_buf    = NULL;
+    const coord_t*            input_trans        = NULL;
     const coord_t**           input_trans_sorted = NULL;
     size_t                    ninput_unique      = ninput;
     const coord_t**           ref_sorted         = NULL;
@@ -184,13 +185,21 @@ xyxymatch(
     /****************************************
      PREPARE INPUT COORDINATES
     */
-    input_trans = malloc_with_error(ninput * sizeof(coord_t), error);
-    if (input_trans == NULL) goto exit;
-
     input_trans_sorted = malloc_with_error(ninput * sizeof(coord_t*), error);
     if (input_trans_sorted == NULL) goto exit;
 
-    apply_lintransform(&lintransform, ninput, input, input_trans);
+    /* With the default origin, mag, rotation and ref_origin the
+       transform does nothing, so sort the input in place of a copy */
+    if (lintransform_is_identity(&lintransform)) {
+        input_trans = input;
+    } else {
+        input_trans_buf = malloc_with_error(ninput * sizeof(coord_t), error);
+        if (input_trans_buf == NULL) goto exit;
+
+        apply_lintransform(&lintransform, ninput, input, input_trans_buf);
+        input_trans = input_trans_buf;
+    }
+
     xysort(ninput, input_trans, input_trans_sorted);
     ninput_unique = xycoincide(ninput, input_trans_sorted, input_trans_sorted, separation);
 
@@ -234,7 +243,7 @@ exit:
 
     free(ref_sorted);
     free(input_trans_sorted);
-    free(input_trans);
+    free(input_trans_buf);
     return status;
 }
 
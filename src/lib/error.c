@@ -45,11 +45,9 @@ void
 stimage_error_init(
     stimage_error_t* const error) {
 
-    size_t i;
-
-    for (i = 0; i < STIMAGE_MAX_ERROR_LEN; ++i) {
-        error->message[i] = '\0';
-    }
+    /* Every writer terminates the message, so only the first byte
+       needs clearing to mark the error as unset */
+    error->message[0] = '\0';
 }
 
 void
@@ -60,7 +58,8 @@ stimage_error_set_message(
   assert(error);
   assert(message);
 
-  strncpy(error->message, message, STIMAGE_MAX_ERROR_LEN);
+  strncpy(error->message, message, STIMAGE_MAX_ERROR_LEN - 1);
+  error->message[STIMAGE_MAX_ERROR_LEN - 1] = '\0';
 
   #if DEBUG
     printf("ERROR RAISED:\n%s\n", error->message);
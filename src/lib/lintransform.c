@@ -73,18 +73,39 @@ apply_lintransform(
 
     size_t i;
     double x, y;
+    double a, b, c, d, e, f;
 
     assert(coeffs);
     assert(input);
     assert(output);
 
+    /* Copy the coefficients to locals: output may alias *coeffs as far
+       as the compiler knows, which would otherwise force a reload of
+       all six on every iteration */
+    a = coeffs->a;
+    b = coeffs->b;
+    c = coeffs->c;
+    d = coeffs->d;
+    e = coeffs->e;
+    f = coeffs->f;
+
     for (i = 0; i < ncoords; ++i) {
         assert(coord_is_finite(input + i));
 
         x = input[i].x;
         y = input[i].y;
 
-        output[i].x = coeffs->a * x + coeffs->b * y + coeffs->c;
-        output[i].y = coeffs->d * x + coeffs->e * y + coeffs->f;
+        output[i].x = a * x + b * y + c;
+        output[i].y = d * x + e * y + f;
     }
 }
+
+int
+lintransform_is_identity(
+    const lintransform_t* const coeffs) {
+
+    assert(coeffs);
+
+    return (coeffs->a == 1.0 && coeffs->b == 0.0 && coeffs->c == 0.0 &&
+            coeffs->d == 0.0 && coeffs->e == 1.0 && coeffs->f == 0.0);
+}
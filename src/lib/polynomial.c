@@ -101,7 +101,7 @@ eval_1dpoly(
 
     free(tmp);
 
-    return 0;
+    return status;
 }
 
 int
@@ -195,7 +195,7 @@ eval_1dchebyshev(
     free(pnm1);
     free(pnm2);
 
-    return 0;
+    return status;
 }
 
 int
@@ -486,10 +486,13 @@ eval_poly_generic(
         return 0;
     }
 
-    /* Fit first order in x and y */
+    /* Fit first order in x and y.  These skip building the basis
+       arrays altogether, so they must apply the constant term and the
+       range normalization themselves (for polynomials k1 = 0 and
+       k2 = 1, so the latter is a no-op). */
     if (xorder == 2 && yorder == 1) {
         for (i = 0; i < ncoord; ++i) {
-            zfit[i] += ref[i].x * coeff[1];
+            zfit[i] = coeff[0] + (ref[i].x + k1x) * k2x * coeff[1];
         }
 
         return 0;
@@ -497,7 +500,7 @@ eval_poly_generic(
 
     if (yorder == 2 && xorder == 1) {
         for (i = 0; i < ncoord; ++i) {
-            zfit[i] += ref[i].y * coeff[1];
+            zfit[i] = coeff[0] + (ref[i].y + k1y) * k2y * coeff[1];
         }
 
         return 0;
@@ -505,7 +508,9 @@ eval_poly_generic(
 
     if (yorder == 2 && xorder == 2 && xterms == xterms_none) {
         for (i = 0; i < ncoord; ++i) {
-            zfit[i] += ref[i].x * coeff[1] + ref[i].y * coeff[2];
+            zfit[i] = coeff[0] +
+                (ref[i].x + k1x) * k2x * coeff[1] +
+                (ref[i].y + k1y) * k2y * coeff[2];
         }
 
         return 0;
@@ -528,6 +533,9 @@ eval_poly_generic(
     }
 
     if (xterms != xterms_none) {
+        /* For each power of y, sum the x terms that go with it, then
+           scale by the y basis.  With half cross-terms, the number of x
+           terms shrinks as the y power increases. */
         xincr = xorder;
         ybp = yb;
         for (j = 0; j < yorder; ++j) {
@@ -539,20 +547,20 @@ eval_poly_generic(
                 for (i = 0; i < ncoord; ++i) {
                     accum[i] += xbp[i] * coeff[cp+k];
                 }
+                xbp += ncoord;
             }
-            xbp += ncoord;
-        }
 
-        for (i = 0; i < ncoord; ++i) {
-            zfit[i] += accum[i] * ybp[i];
-        }
+            for (i = 0; i < ncoord; ++i) {
+                zfit[i] += accum[i] * ybp[i];
+            }
 
-        cp += xincr;
-        ybp += ncoord;
+            cp += xincr;
+            ybp += ncoord;
 
-        if (xterms == xterms_half) {
-            if ((j + xorder + 1) > maxorder) {
-                xincr -= 1;
+            if (xterms == xterms_half) {
+                if ((j + xorder + 2) > maxorder) {
+                    xincr -= 1;
+                }
             }
         }
     } else { /* xterms == surface_xterms_none */
@@ -50,7 +50,8 @@ malloc_with_error(
 
     result = malloc(size);
     if (result == NULL) {
-        stimage_error_format_message(error, "Error allocating %u bytes", size);
+        stimage_error_format_message(
+                error, "Error allocating %lu bytes", (unsigned long)size);
     }
     return result;
 }
@@ -67,7 +68,9 @@ calloc_with_error(
 
     result = calloc(nmemb, size);
     if (result == NULL) {
-        stimage_error_format_message(error, "Error allocating %u bytes", size);
+        stimage_error_format_message(
+                error, "Error allocating %lu bytes",
+                (unsigned long)(nmemb * size));
     }
     return result;
 }
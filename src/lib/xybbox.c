@@ -77,6 +77,7 @@ limit_to_bbox(
 
     size_t i = 0;
     size_t nout = 0;
+    double xmin, xmax, ymin, ymax;
 
     assert(input);
     assert(ref);
@@ -85,17 +86,16 @@ limit_to_bbox(
     assert(ref_in_bbox);
     assert(bbox_is_valid(bbox));
 
+    /* Resolve the limits once; an undefined limit becomes an infinite
+       one so that it never excludes a point */
+    xmin = isfinite(bbox->min.x) ? bbox->min.x : -HUGE_VAL;
+    xmax = isfinite(bbox->max.x) ? bbox->max.x : HUGE_VAL;
+    ymin = isfinite(bbox->min.y) ? bbox->min.y : -HUGE_VAL;
+    ymax = isfinite(bbox->max.y) ? bbox->max.y : HUGE_VAL;
+
     for (i = 0; i < ncoord; ++i) {
-        if (isfinite(bbox->min.x) && ref[i].x < bbox->min.x) {
-            continue;
-        }
-        if (isfinite(bbox->max.x) && ref[i].x > bbox->max.x) {
-            continue;
-        }
-        if (isfinite(bbox->min.y) && ref[i].y < bbox->min.y) {
-            continue;
-        }
-        if (isfinite(bbox->max.y) && ref[i].y > bbox->max.y) {
+        if (ref[i].x < xmin || ref[i].x > xmax ||
+            ref[i].y < ymin || ref[i].y > ymax) {
             continue;
         }
 
@@ -117,7 +117,18 @@ determine_bbox(
         const coord_t* const a,
         bbox_t* const bbox) {
 
+    determine_bbox_and_mean(n, a, bbox, NULL);
+}
+
+void
+determine_bbox_and_mean(
+        size_t n,
+        const coord_t* const a,
+        bbox_t* const bbox,
+        coord_t* const mean) {
+
     size_t i = 0;
+    coord_t sum = {0.0, 0.0};
 
     assert(a);
     assert(bbox);
@@ -136,6 +147,9 @@ determine_bbox(
     }
 
     for (i = 0; i < n; ++i) {
+        sum.x += a[i].x;
+        sum.y += a[i].y;
+
         if (isfinite(a[i].x)) {
             if (a[i].x < bbox->min.x) {
                 bbox->min.x = a[i].x;
@@ -154,6 +168,11 @@ determine_bbox(
             }
         }
     }
+
+    if (mean != NULL) {
+        mean->x = sum.x / (double)n;
+        mean->y = sum.y / (double)n;
+    }
 }
 
 void
@@ -52,6 +52,7 @@ xycoincide(
     double r2 = 0.0;
     size_t iprev = 0;
     size_t i = 0;
+    const coord_t* prev = NULL;
 
     assert(input);
     assert(output);
@@ -67,6 +68,10 @@ xycoincide(
             continue;
         }
 
+        /* Hold on to the current object, since the stores into output
+           below would otherwise force it to be re-read each time */
+        prev = output[iprev];
+
         for (i = iprev + 1; i < ncoords; ++i) {
             /* Skip to the next object if this one has been deleted */
             if (output[i] == NULL) {
@@ -75,7 +80,7 @@ xycoincide(
 
             /* Check the tolerance limit in y and step to the next
                object if the bounds are exceeded */
-            distance = output[i]->y - output[iprev]->y;
+            distance = output[i]->y - prev->y;
             r2 = distance * distance;
             if (r2 > tolerance2) {
                 break;
@@ -83,7 +88,7 @@ xycoincide(
 
             /* Check the tolerance limit in x, and delete if too
                close */
-            distance = output[i]->x - output[iprev]->x;
+            distance = output[i]->x - prev->x;
             r2 += distance * distance;
             if (r2 <= tolerance2) {
                 /* Delete it */
@@ -30,6 +30,7 @@ DAMAGE.
 */
 
 #include <assert.h>
+#include <string.h>
 
 #include "surface/cholesky.h"
 
@@ -84,21 +85,23 @@ cholesky_factorization(
 
         assert(MATFAC(0, n) != 0.0);
         MATFAC(0, n) = 1.0 / MATFAC(0, n);
-        imax = MIN(nbands - 1, nrows - n);
-        if (imax < 0) {
+
+        /* DIFF: The original is 1-based, so the band and row offsets
+           below are all one greater than a literal translation */
+        imax = (int)MIN(nbands - 1, nrows - n - 1);
+        if (imax < 1) {
             continue;
         }
 
         jmax = imax;
         for (i = 0; i < (size_t)imax; ++i) {
-            assert(n < nbands && i+1 < nrows);
+            assert(i+1 < nbands);
             ratio = MATFAC(i+1, n) * MATFAC(0, n);
             for (j = 0; j < (size_t)jmax; ++j) {
-                assert(n+i < nbands && j < nrows && j+i < nrows);
-                MATFAC(j, n+i) = MATFAC(j, n+i) - MATFAC(j+i, n) * ratio;
+                assert(n+i+1 < nrows && j+i+1 < nbands);
+                MATFAC(j, n+i+1) = MATFAC(j, n+i+1) - MATFAC(j+i+1, n) * ratio;
             }
             --jmax;
-            assert(n < nbands && i+1 < nrows);
             MATFAC(i+1, n) = ratio;
         }
     }
@@ -121,7 +124,7 @@ cholesky_solve(
 
     #define MATFAC(j, i) (matfac[(i)*nbands+(j)])
 
-    size_t i, j, jmax, nbands_m1;
+    size_t j, jmax, nbands_m1;
     int n;
 
     assert(matfac);
@@ -137,17 +140,15 @@ cholesky_solve(
     }
 
     /* Copy vector to coefficients */
-    for (i = 0; i < nrows; ++i) {
-        coeff[i] = vector[i];
-    }
+    memcpy(coeff, vector, nrows * sizeof(double));
 
     /* Forward substitution */
     nbands_m1 = nbands - 1;
     for (n = 0; n < (int)nrows; ++n) {
-        jmax = MIN(nbands_m1, nrows - n);
+        jmax = MIN(nbands_m1, nrows - n - 1);
         if (jmax >= 1) {
             for (j = 0; j < jmax; ++j) {
-                coeff[j+n] -= MATFAC(j+1, n) * coeff[n];
+                coeff[j+n+1] -= MATFAC(j+1, n) * coeff[n];
             }
         }
     }
@@ -155,10 +156,10 @@ cholesky_solve(
     /* Back substitution */
     for (n = (int)nrows - 1; n >= 0; --n) {
         coeff[n] *= MATFAC(0, n);
-        jmax = MIN(nbands_m1, nrows - n);
+        jmax = MIN(nbands_m1, nrows - n - 1);
         if (jmax >= 1) {
             for (j = 0; j < jmax; ++j) {
-                coeff[n] -= MATFAC(j+1, n) * coeff[j+n];
+                coeff[n] -= MATFAC(j+1, n) * coeff[j+n+1];
             }
         }
     }
@@ -179,7 +179,9 @@ surface_fit_add_points(
 
         bxp = xbasis;
 
-        for (k = 1; k <= s->xorder; ++k) {
+        /* xorder is the number of x terms that go with this power of
+           y, which shrinks as l increases unless xterms is full */
+        for (k = 1; k <= (size_t)xorder; ++k) {
             for (i = 0; i < ncoord; ++i) {
                 bw[i] = byw[i] * bxp[i];
             }
@@ -248,8 +250,6 @@ surface_fit_add_points(
 
     status = 0;
 
-    surface_print(s);
-
  exit:
 
     free(byw);
@@ -302,8 +302,6 @@ surface_fit_solve(
         return 1;
     }
 
-    surface_print(s);
-
     return 0;
 }
 
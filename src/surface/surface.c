@@ -88,9 +88,9 @@ surface_init(
             goto fail;
         }
         s->xrange = 2.0 / (bbox->max.x - bbox->min.x);
-        s->xmaxmin = -(bbox->max.x - bbox->min.x) / 2.0;
+        s->xmaxmin = -(bbox->max.x + bbox->min.x) / 2.0;
         s->yrange = 2.0 / (bbox->max.y - bbox->min.y);
-        s->ymaxmin = -(bbox->max.y - bbox->min.y) / 2.0;
+        s->ymaxmin = -(bbox->max.y + bbox->min.y) / 2.0;
         break;
 
     case surface_type_polynomial:
@@ -128,21 +128,19 @@ surface_init(
     s->type = function;
     bbox_copy(bbox, &s->bbox);
 
+    /* calloc hands back zeroed memory, so there is no need for a
+       separate surface_zero pass here */
     s->matrix =
-        malloc_with_error(s->ncoeff * s->ncoeff * sizeof(double), error);
+        calloc_with_error(s->ncoeff * s->ncoeff, sizeof(double), error);
     if (s->matrix == NULL) goto fail;
     s->cholesky_fact =
-        malloc_with_error(s->ncoeff * s->ncoeff * sizeof(double), error);
+        calloc_with_error(s->ncoeff * s->ncoeff, sizeof(double), error);
     if (s->cholesky_fact == NULL) goto fail;
-    s->vector = malloc_with_error(s->ncoeff * sizeof(double), error);
+    s->vector = calloc_with_error(s->ncoeff, sizeof(double), error);
     if (s->vector == NULL) goto fail;
-    s->coeff = malloc_with_error(s->ncoeff * sizeof(double), error);
+    s->coeff = calloc_with_error(s->ncoeff, sizeof(double), error);
     if (s->coeff == NULL) goto fail;
 
-    if (surface_zero(s, error)) {
-        return 1;
-    }
-
     s->npoints = 0;
 
     return 0;
@@ -182,15 +180,11 @@ surface_copy_vector(
         double** const d,
         stimage_error_t* const error) {
 
-    size_t i;
-
     if (s != NULL) {
         free(*d);
         *d = malloc_with_error(size * sizeof(double), error);
         if (*d == NULL) return 1;
-        for (i = 0; i < size; ++i) {
-            (*d)[i] = s[i];
-        }
+        memcpy(*d, s, size * sizeof(double));
     }
 
     return 0;
@@ -247,8 +241,6 @@ surface_zero(
         surface_t* const s,
         stimage_error_t* const error) {
 
-    size_t i;
-
     assert(s);
     assert(s->vector);
     assert(s->matrix);
@@ -259,21 +251,10 @@ surface_zero(
     case surface_type_chebyshev:
         /* s->npoints = 0; */
 
-        for (i = 0; i < s->ncoeff; ++i) {
-            s->vector[i] = 0.0;
-        }
-
-        for (i = 0; i < s->ncoeff; ++i) {
-            s->coeff[i] = 0.0;
-        }
-
-        for (i = 0; i < s->ncoeff * s->ncoeff; ++i) {
-            s->matrix[i] = 0.0;
-        }
-
-        for (i = 0; i < s->ncoeff * s->ncoeff; ++i) {
-            s->cholesky_fact[i] = 0.0;
-        }
+        memset(s->vector, 0, s->ncoeff * sizeof(double));
+        memset(s->coeff, 0, s->ncoeff * sizeof(double));
+        memset(s->matrix, 0, s->ncoeff * s->ncoeff * sizeof(double));
+        memset(s->cholesky_fact, 0, s->ncoeff * s->ncoeff * sizeof(double));
 
         break;
     default:
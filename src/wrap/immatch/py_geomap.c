@@ -83,13 +83,8 @@ geomap_array_init() {
 static int
 geomap_init(geomap_object *self, PyObject *args, PyObject *kwds)
 {
-#if PY_MAJOR_VERSION >= 3
     self->fit_geometry = PyUnicode_FromString("");
     self->function = PyUnicode_FromString("");
-#else
-    self->fit_geometry = PyString_FromString("");
-    self->function = PyString_FromString("");
-#endif
     
     self->rms = geomap_array_init();
     if (self->rms == NULL) return -1;
@@ -203,6 +198,10 @@ static PyTypeObject geomap_class = {
     geomap_new,                /* tp_new */
 };
 
+/* The output record type never changes, so it is built on the first
+   call and reused afterwards */
+static PyArray_Descr* geomap_dtype = NULL;
+
 PyObject*
 py_geomap(PyObject* self, PyObject* args, PyObject* kwds) {
     PyObject* input_obj        = NULL;
@@ -240,6 +239,7 @@ py_geomap(PyObject* self, PyObject* args, PyObject* kwds) {
     PyArray_Descr*   dtype        = NULL;
     PyObject*        result       = NULL;
     PyObject*        output_array = NULL;
+    int              status       = 0;
     stimage_error_t  error;
 
     const char*    keywords[]    = {
@@ -298,45 +298,65 @@ py_geomap(PyObject* self, PyObject* args, PyObject* kwds) {
         goto exit;
     }
 
-    if (geomap(
-                ninput, (coord_t*)PyArray_DATA(input_array),
-                nref, (coord_t*)PyArray_DATA(ref_array),
-                &bbox, fit_geometry, surface_type,
-                xxorder, xyorder, yxorder, yyorder,
-                xxterms, yxterms,
-                maxiter, reject,
-                &noutput, output, &fit,
-                &error)) {
+    /* The fit touches no Python objects, so let other threads run
+       while it does its work */
+    Py_BEGIN_ALLOW_THREADS
+    status = geomap(
+            ninput, (coord_t*)PyArray_DATA(input_array),
+            nref, (coord_t*)PyArray_DATA(ref_array),
+            &bbox, fit_geometry, surface_type,
+            xxorder, xyorder, yxorder, yyorder,
+            xxterms, yxterms,
+            maxiter, reject,
+            &noutput, output, &fit,
+            &error);
+    Py_END_ALLOW_THREADS
+    if (status) {
         PyErr_SetString(PyExc_RuntimeError, stimage_error_get_message(&error));
         goto exit;
     }
 
-    dtype_list = Py_BuildValue(
-            "[(ss)(ss)(ss)(ss)(ss)(ss)(ss)(ss)]",
-            "input_x", "f8",
-            "input_y", "f8",
-            "ref_x", "f8",
-            "ref_y", "f8",
-            "fit_x", "f8",
-            "fit_y", "f8",
-            "resid_x", "f8",
-            "resid_y", "f8");
-    if (dtype_list == NULL) {
-        goto exit;
-    }
-    if (!PyArray_DescrConverter(dtype_list, &dtype)) {
-        goto exit;
+    if (geomap_dtype == NULL) {
+        dtype_list = Py_BuildValue(
+                "[(ss)(ss)(ss)(ss)(ss)(ss)(ss)(ss)]",
+                "input_x", "f8",
+                "input_y", "f8",
+                "ref_x", "f8",
+                "ref_y", "f8",
+                "fit_x", "f8",
+                "fit_y", "f8",
+                "resid_x", "f8",
+                "resid_y", "f8");
+        if (dtype_list == NULL) {
+            goto exit;
+        }
+        if (!PyArray_DescrConverter(dtype_list, &geomap_dtype)) {
+            Py_DECREF(dtype_list);
+            goto exit;
+        }
+        Py_DECREF(dtype_list);
     }
-    Py_DECREF(dtype_list);
-    dims = (npy_intp)noutput;
-    output_array = PyArray_NewFromDescr(
-            &PyArray_Type, dtype, 1, &dims, NULL, output,
-            NPY_OWNDATA, NULL);
+    /* to_owned_array steals a reference to the dtype */
+    dtype = geomap_dtype;
+    Py_INCREF(dtype);
+    output_array = to_owned_array(
+            dtype, (npy_intp)noutput, (void**)&output);
     if (output_array == NULL) {
         goto exit;
     }
 
+    /* The results type is only needed once geomap is actually called,
+       so it is readied here on first use rather than at import */
+    if (!(geomap_class.tp_flags & Py_TPFLAGS_READY)) {
+        if (PyType_Ready(&geomap_class) < 0) {
+            goto exit;
+        }
+    }
+
     fit_obj = geomap_new(&geomap_class, NULL, NULL);
+    if (fit_obj == NULL) {
+        goto exit;
+    }
     
     #define ADD_ATTR(func, member, name) \
         if ((func)((member), &tmp)) goto exit;      \
@@ -364,24 +384,20 @@ py_geomap(PyObject* self, PyObject* args, PyObject* kwds) {
     ADD_ARRAY(fit.nx2coeff, fit.x2coeff, "x2coeff");
     ADD_ARRAY(fit.ny2coeff, fit.y2coeff, "y2coeff");
 
-    result = Py_BuildValue("OO", fit_obj, output_array);
+    result = PyTuple_Pack(2, fit_obj, output_array);
 
  exit:
 
-    Py_DECREF(input_array);
-    Py_DECREF(ref_array);
+    Py_XDECREF(input_array);
+    Py_XDECREF(ref_array);
     geomap_result_free(&fit);
-    if (result == NULL) {
-        Py_XDECREF(output_array);
-        free(output);
-        Py_XDECREF(fit_obj);
-    }
+    free(output);
+    Py_XDECREF(output_array);
+    Py_XDECREF(fit_obj);
 
     return result;
 }
 
-#if PY_MAJOR_VERSION >= 3
-
 static PyModuleDef geomap_module = {
     PyModuleDef_HEAD_INIT,
     "geomap_results",
@@ -407,20 +423,3 @@ PyInit_geomap_results(void)
     PyModule_AddObject(m, "GeomapResults", (PyObject *)&geomap_class);
     return m;
 }
-
-#else
-PyMODINIT_FUNC
-initgeomap_results(void) 
-{
-    PyObject* m;
-
-    geomap_class.tp_new = PyType_GenericNew;
-    if (PyType_Ready(&geomap_class) < 0)
-        return;
-
-    m = Py_InitModule("GeomapResults", geomap_methods);
-
-    Py_INCREF(&geomap_class);
-    PyModule_AddObject(m, "GeomapResults", (PyObject *)&geomap_class);
-}
-#endif
@@ -41,6 +41,10 @@ DAMAGE.
 
 #include "immatch/xyxymatch.h"
 
+/* The output record type never changes, so it is built on the first
+   call and reused afterwards */
+static PyArray_Descr* xyxymatch_dtype = NULL;
+
 PyObject*
 py_xyxymatch(PyObject* self, PyObject* args, PyObject* kwds) {
     PyObject* input_obj      = NULL;
@@ -69,7 +73,7 @@ py_xyxymatch(PyObject* self, PyObject* args, PyObject* kwds) {
     xyxymatch_output_t* output     = NULL;
     PyObject*           dtype_list = NULL;
     PyArray_Descr*      dtype      = NULL;
-    npy_intp            dims;
+    int                 status;
     stimage_error_t     error;
 
     const char*    keywords[]    = {
@@ -122,43 +126,50 @@ py_xyxymatch(PyObject* self, PyObject* args, PyObject* kwds) {
         result = PyErr_NoMemory();
         goto exit;
     }
-    if (xyxymatch(
-                PyArray_DIM(input_array, 0), (coord_t*)PyArray_DATA(input_array),
-                PyArray_DIM(ref_array, 0), (coord_t*)PyArray_DATA(ref_array),
-                &noutput, output,
-                &origin, &mag, &rotation, &ref_origin,
-                algorithm, tolerance, separation, nmatch, maxratio, nreject,
-                &error)) {
+    /* The matching itself touches no Python objects, so let other
+       threads run while it does its work */
+    Py_BEGIN_ALLOW_THREADS
+    status = xyxymatch(
+            PyArray_DIM(input_array, 0), (coord_t*)PyArray_DATA(input_array),
+            PyArray_DIM(ref_array, 0), (coord_t*)PyArray_DATA(ref_array),
+            &noutput, output,
+            &origin, &mag, &rotation, &ref_origin,
+            algorithm, tolerance, separation, nmatch, maxratio, nreject,
+            &error);
+    Py_END_ALLOW_THREADS
+    if (status) {
         PyErr_SetString(PyExc_RuntimeError, stimage_error_get_message(&error));
         goto exit;
     }
 
-    dtype_list = Py_BuildValue(
-            "[(ss)(ss)(ss)(ss)(ss)(ss)]",
-            "input_x", "f8",
-            "input_y", "f8",
-            "input_idx", SIZE_T_D,
-            "ref_x", "f8",
-            "ref_y", "f8",
-            "ref_idx", SIZE_T_D);
-    if (dtype_list == NULL) {
-        goto exit;
+    if (xyxymatch_dtype == NULL) {
+        dtype_list = Py_BuildValue(
+                "[(ss)(ss)(ss)(ss)(ss)(ss)]",
+                "input_x", "f8",
+                "input_y", "f8",
+                "input_idx", SIZE_T_D,
+                "ref_x", "f8",
+                "ref_y", "f8",
+                "ref_idx", SIZE_T_D);
+        if (dtype_list == NULL) {
+            goto exit;
+        }
+        if (!PyArray_DescrConverter(dtype_list, &xyxymatch_dtype)) {
+            Py_DECREF(dtype_list);
+            goto exit;
+        }
+        Py_DECREF(dtype_list);
     }
-    if (!PyArray_DescrConverter(dtype_list, &dtype)) {
-        goto exit;
-    }
-    Py_DECREF(dtype_list);
-    dims = (npy_intp)noutput;
-    result = PyArray_NewFromDescr(
-            &PyArray_Type, dtype, 1, &dims, NULL, output, NPY_OWNDATA, NULL);
+    /* to_owned_array steals a reference to the dtype */
+    dtype = xyxymatch_dtype;
+    Py_INCREF(dtype);
+    result = to_owned_array(dtype, (npy_intp)noutput, (void**)&output);
 
  exit:
 
-    Py_DECREF(input_array);
-    Py_DECREF(ref_array);
-    if (result == NULL) {
-        free(output);
-    }
+    Py_XDECREF(input_array);
+    Py_XDECREF(ref_array);
+    free(output);
 
     return result;
 }
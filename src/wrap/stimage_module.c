@@ -45,7 +45,6 @@ static PyMethodDef module_methods[] = {
     {NULL}  /* Sentinel */
 };
 
-#if PY_MAJOR_VERSION >= 3
 static struct PyModuleDef moduledef = {
   PyModuleDef_HEAD_INIT,
   "_stimage",          /* m_name */
@@ -57,14 +56,9 @@ static struct PyModuleDef moduledef = {
   NULL,                /* m_clear */
   NULL,                /* m_free */
 };
-#endif
 
 PyMODINIT_FUNC
-#if PY_MAJOR_VERSION >= 3
 PyInit__stimage(void)
-#else
-init_stimage(void)
-#endif
 {
     PyObject* m;
 
@@ -72,12 +66,6 @@ init_stimage(void)
 
     SIZE_T_D = sizeof(size_t) == 8 ? "u8" : "u4";
 
-#if PY_MAJOR_VERSION >= 3
     m = PyModule_Create(&moduledef);
-	return m;
-#else
-    m = Py_InitModule3("_stimage", module_methods,
-                       "Example module that creates an extension type.");
-	return;
-#endif
+    return m;
 }
@@ -40,6 +40,45 @@ DAMAGE.
 
 char* SIZE_T_D;
 
+static void
+free_owned_buffer(
+        PyObject* capsule) {
+
+    free(PyCapsule_GetPointer(capsule, NULL));
+}
+
+PyObject*
+to_owned_array(
+        PyArray_Descr* dtype,
+        npy_intp n,
+        void** const data) {
+
+    PyObject* array = NULL;
+    PyObject* capsule = NULL;
+
+    array = PyArray_NewFromDescr(
+            &PyArray_Type, dtype, 1, &n, NULL, *data, NPY_ARRAY_CARRAY, NULL);
+    if (array == NULL) {
+        return NULL;
+    }
+
+    capsule = PyCapsule_New(*data, NULL, &free_owned_buffer);
+    if (capsule == NULL) {
+        Py_DECREF(array);
+        return NULL;
+    }
+    *data = NULL;
+
+    /* Steals the reference to capsule, even on failure, in which case
+       the buffer is freed along with it */
+    if (PyArray_SetBaseObject((PyArrayObject*)array, capsule)) {
+        Py_DECREF(array);
+        return NULL;
+    }
+
+    return array;
+}
+
 int
 to_coord_t(
         const char* const name,
@@ -230,11 +269,7 @@ from_geomap_fit_e(
         return -1;
     }
 
-#if PY_MAJOR_VERSION >= 3
     *o = PyUnicode_FromString(c);
-#else
-    *o = PyString_FromString(c);
-#endif
     if (*o == NULL) {
         return -1;
     }
@@ -294,11 +329,7 @@ from_surface_type_e(
         return -1;
     }
 
-#if PY_MAJOR_VERSION >= 3
     *o = PyUnicode_FromString(c);
-#else
-    *o = PyString_FromString(c);
-#endif
     if (*o == NULL) {
         return -1;
     }
@@ -358,11 +389,7 @@ from_xterms_e(
         return -1;
     }
 
-#if PY_MAJOR_VERSION >= 3
     *o = PyUnicode_FromString(c);
-#else
-    *o = PyString_FromString(c);
-#endif
     if (*o == NULL) {
         return -1;
     }
@@ -49,6 +49,22 @@ DAMAGE.
 
 extern char* SIZE_T_D;
 
+/**
+Wrap a malloc'd buffer of n records in a new 1-dimensional array.
+The array takes ownership of the buffer and frees it when it is
+destroyed.  Like PyArray_NewFromDescr, this steals a reference to
+dtype.
+
+Once the buffer has been handed over, *data is set to NULL, so the
+caller can always free(*data) afterward, whether or not this
+succeeded.
+*/
+PyObject*
+to_owned_array(
+        PyArray_Descr* dtype,
+        npy_intp n,
+        void** const data);
+
 int
 to_coord_t(
         const char* const name,
@@ -28,19 +28,117 @@
 # DAMAGE.
 
 import numpy as np
+import pytest
+
 import stsci.stimage as stimage
 
-# def test_same():
-#     np.random.seed(0)
-#     x = np.random.random((512, 2))
-#     y = x[:]
+def test_same():
+    np.random.seed(0)
+    x = np.random.random((512, 2))
+    y = x[:]
+
+    fit, output = stimage.geomap(x, y, fit_geometry='general',
+                                 function='polynomial')
+
+    assert len(output) == 512
+    np.testing.assert_allclose(fit.xcoeff, [0.0, 1.0, 0.0], atol=1e-10)
+    np.testing.assert_allclose(fit.ycoeff, [0.0, 0.0, 1.0], atol=1e-10)
+    np.testing.assert_allclose(fit.rms, [0.0, 0.0], atol=1e-10)
+
+@pytest.mark.parametrize('function', ['polynomial', 'chebyshev', 'legendre'])
+def test_rotate_scale_shift(function):
+    np.random.seed(0)
+    ref = np.random.random((64, 2)) * 100.0
+    theta = np.radians(10.0)
+    rot = np.array([[np.cos(theta), -np.sin(theta)],
+                    [np.sin(theta), np.cos(theta)]])
+    x = np.dot(ref, rot.T) * 1.5 + [5.0, 3.0]
+
+    fit, output = stimage.geomap(x, ref, fit_geometry='general',
+                                 function=function)
+
+    np.testing.assert_allclose(fit.shift, [5.0, 3.0], atol=1e-8)
+    np.testing.assert_allclose(fit.mag, [1.5, 1.5], atol=1e-8)
+    np.testing.assert_allclose(fit.rotation, [350.0, 350.0], atol=1e-8)
+    np.testing.assert_allclose(fit.rms, [0.0, 0.0], atol=1e-8)
+
+@pytest.mark.parametrize('function', ['polynomial', 'chebyshev', 'legendre'])
+@pytest.mark.parametrize(
+    ('fit_geometry', 'mag', 'rotation'),
+    [('shift', [1.0, 1.0], 0.0),
+     ('xyscale', [1.5, 0.8], 0.0),
+     ('rotate', [1.0, 1.0], 10.0),
+     ('rscale', [1.5, 1.5], 10.0),
+     ('rxyscale', [1.5, 0.8], 10.0)])
+def test_fit_geometry(fit_geometry, mag, rotation, function):
+    np.random.seed(0)
+    ref = np.random.random((64, 2)) * 100.0
+    theta = np.radians(rotation)
+    rot = np.array([[np.cos(theta), -np.sin(theta)],
+                    [np.sin(theta), np.cos(theta)]])
+    x = np.dot(ref * mag, rot.T) + [5.0, 3.0]
+
+    fit, output = stimage.geomap(x, ref, fit_geometry=fit_geometry,
+                                 function=function)
+
+    np.testing.assert_allclose(fit.shift, [5.0, 3.0], atol=1e-8)
+    np.testing.assert_allclose(fit.mag, mag, atol=1e-8)
+    # The rotation is reported in the sense of IRAF's geomap, as
+    # 360 - rotation, so compare the two modulo 360
+    np.testing.assert_allclose(
+        (fit.rotation + rotation + 180.0) % 360.0 - 180.0, [0.0, 0.0],
+        atol=1e-8)
+    np.testing.assert_allclose(fit.rms, [0.0, 0.0], atol=1e-8)
+
+def test_reject():
+    np.random.seed(0)
+    ref = np.random.random((64, 2)) * 100.0
+    x = ref + [5.0, 3.0]
+    outliers = [3, 17, 40, 41, 60]
+    x[outliers] += [[30.0, -20.0], [-25.0, 0.0], [0.0, 40.0],
+                    [50.0, 50.0], [-40.0, 10.0]]
+
+    fit, output = stimage.geomap(x, ref, maxiter=3, reject=3.0)
+
+    rejected = np.isnan(output['fit_x'])
+    assert list(np.where(rejected)[0]) == outliers
+    assert np.all(np.isnan(output['resid_x'][rejected]))
+    assert np.all(np.isfinite(output['resid_x'][~rejected]))
+    np.testing.assert_allclose(fit.shift, [5.0, 3.0], atol=1e-8)
+    np.testing.assert_allclose(fit.rms, [0.0, 0.0], atol=1e-8)
+
+def test_reject_first_point():
+    # The first rejected point must land in the first slot of the
+    # rejection list, or it is never flagged in the output
+    np.random.seed(0)
+    ref = np.random.random((64, 2)) * 100.0
+    x = ref + [5.0, 3.0]
+    x[0] += [30.0, 30.0]
+
+    fit, output = stimage.geomap(x, ref, maxiter=3, reject=3.0)
+
+    assert list(np.where(np.isnan(output['fit_x']))[0]) == [0]
+    np.testing.assert_allclose(fit.rms, [0.0, 0.0], atol=1e-8)
 
-#     r = stimage.geomap(x, y, fit_geometry='general', function='polynomial')
+@pytest.mark.parametrize('function', ['polynomial', 'chebyshev', 'legendre'])
+@pytest.mark.parametrize('order', [3, 4])
+@pytest.mark.parametrize('xterms', ['half', 'full'])
+def test_cross_terms(function, order, xterms):
+    np.random.seed(0)
+    ref = np.random.random((100, 2)) * 100.0
+    xr, yr = ref[:, 0], ref[:, 1]
+    x = np.column_stack([
+        5.0 + 1.01 * xr + 0.02 * yr +
+        1e-4 * xr * xr + 2e-4 * xr * yr - 1e-4 * yr * yr,
+        3.0 - 0.01 * xr + 0.99 * yr -
+        2e-4 * xr * xr + 1e-4 * xr * yr + 3e-4 * yr * yr])
 
-#     print r
-#     print r[0].fit_geometry
+    fit, output = stimage.geomap(
+        x, ref, function=function,
+        xxorder=order, xyorder=order, yxorder=order, yyorder=order,
+        xxterms=xterms, yxterms=xterms)
 
-#     assert False
+    np.testing.assert_allclose(fit.rms, [0.0, 0.0], atol=1e-8)
 
 if __name__ == '__main__':
     test_same()
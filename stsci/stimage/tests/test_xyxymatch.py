@@ -27,9 +27,9 @@
 # USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH
 # DAMAGE.
 
-from __future__ import print_function
-
 import numpy as np
+import pytest
+
 import stsci.stimage as stimage
 
 def test_same():
@@ -72,4 +72,30 @@ def test_different():
         assert r['input_idx'][i] < 512
         assert r['ref_idx'][i] < 512
 
+def test_exact_duplicates():
+    x = np.array([[1.0, 1.0], [1.0, 1.0], [5.0, 5.0], [9.0, 2.0]])
+
+    r = stimage.xyxymatch(x, x, algorithm='tolerance', tolerance=0.5,
+                          separation=0.0)
+
+    # Even with no separation, exact duplicates are removed, so every
+    # input is matched to at most one reference
+    assert len(r) == 3
+    assert len(set(r['input_idx'])) == 3
+    assert len(set(r['ref_idx'])) == 3
+
+def test_bad_shape():
+    x = np.zeros((8, 3))
+    y = np.zeros((8, 2))
+
+    with pytest.raises(TypeError):
+        stimage.xyxymatch(x, y)
+
+    with pytest.raises(TypeError):
+        stimage.xyxymatch(y, x)
+
+    with pytest.raises(TypeError):
+        stimage.geomap(x, y)
 
+    with pytest.raises(TypeError):
+        stimage.geomap(y, x)
@@ -2,8 +2,44 @@
 #include <stdio.h>
 #include <stdlib.h>
 
+#include <math.h>
+
 #include "surface/cholesky.h"
 
 int main(int argv, char** argc) {
+    /* The symmetric matrix
+         4 2 0
+         2 5 1
+         0 1 3
+       in banded form, with the diagonal in band 0 */
+    const double matrix[9] = {4.0, 2.0, 0.0,
+                              5.0, 1.0, 0.0,
+                              3.0, 0.0, 0.0};
+    const double vector[3] = {8.0, 15.0, 11.0};
+    const double expected[3] = {1.0, 2.0, 3.0};
+    double matfac[9];
+    double coeff[3];
+    surface_fit_error_e error_type = surface_fit_error_ok;
+    stimage_error_t error;
+    size_t i;
+
+    stimage_error_init(&error);
+
+    if (cholesky_factorization(3, 3, matrix, matfac, &error_type, &error)) {
+        return 1;
+    }
+
+    if (cholesky_solve(3, 3, matfac, vector, coeff, &error)) {
+        return 1;
+    }
+
+    for (i = 0; i < 3; ++i) {
+        if (fabs(coeff[i] - expected[i]) > 1e-12) {
+            printf("coeff[%lu] = %f, expected %f\n",
+                   (unsigned long)i, coeff[i], expected[i]);
+            return 1;
+        }
+    }
+
     return 0;
 }
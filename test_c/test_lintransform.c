@@ -37,6 +37,9 @@ int main(int argv, char** argc) {
 
     /* First, test identity */
     compute_lintransform(in, mag, rot, out, &transform);
+    if (!lintransform_is_identity(&transform)) {
+        return 1;
+    }
     apply_lintransform(&transform, ncoords, data, data_trans);
 
     for (i = 0; i < ncoords; ++i) {
@@ -51,6 +54,9 @@ int main(int argv, char** argc) {
     mag.y = 2.0;
 
     compute_lintransform(in, mag, rot, out, &transform);
+    if (lintransform_is_identity(&transform)) {
+        return 1;
+    }
     apply_lintransform(&transform, ncoords, data, data_trans);
 
     for (i = 0; i < ncoords; ++i) {